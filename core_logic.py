@@ -9,12 +9,29 @@ Each source has its own scraper class that:
 The Golden Rule: No logic changes in code before updating the logic docs.
 """
 
+import asyncio
+import hashlib
+import io
 import re
+import sys
+import threading
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from html import unescape
 from bs4 import BeautifulSoup
+from lxml import etree
 from datetime import datetime, timezone
 from tools import hash_url, parse_date, truncate_summary, clean_text, now_iso, is_within_days
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
 # ---------------------------------------------------------------------------
 # HTTP Helpers
 # ---------------------------------------------------------------------------
@@ -27,18 +44,187 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
-
-def fetch_html(url: str, timeout: int = 15) -> str | None:
-    """Fetch HTML from a URL. Returns None on failure."""
+# Shared keep-alive session: repeat hits on the same host (e.g. the three
+# subreddit feeds) reuse one TCP+TLS connection instead of handshaking per call.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+# Per-URL validators and body from the last 200 response, for conditional GETs.
+_HTTP_CACHE: dict[str, dict] = {}
+
+
+def _conditional_headers(url: str, headers: dict | None = None) -> dict:
+    """Merge If-None-Match / If-Modified-Since for `url` into `headers`."""
+    merged = dict(headers or {})
+    cached = _HTTP_CACHE.get(url)
+    if cached:
+        if cached["etag"]:
+            merged["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            merged["If-Modified-Since"] = cached["last_modified"]
+    return merged
+
+
+def _remember_response(url: str, resp_headers, body: str | bytes):
+    """Store the validators and body of a 200 response (if it sent any validators)."""
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if etag or last_modified:
+        _HTTP_CACHE[url] = {"etag": etag, "last_modified": last_modified, "body": body}
+
+
+def fetch_html(
+    url: str, timeout: int = 15, headers: dict | None = None, raw: bool = False
+) -> str | bytes | None:
+    """
+    Fetch HTML from a URL. Returns None on failure.
+    Sends conditional headers from the previous response and serves the
+    cached body on 304. With raw=True the undecoded body bytes are returned.
+    """
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=timeout)
+        resp = _SESSION.get(url, headers=_conditional_headers(url, headers), timeout=timeout)
+        if resp.status_code == 304 and url in _HTTP_CACHE:
+            return _HTTP_CACHE[url]["body"]
         resp.raise_for_status()
-        return resp.text
+        body = resp.content if raw else resp.text
+        _remember_response(url, resp.headers, body)
+        return body
     except requests.RequestException as e:
         print(f"[ERROR] Failed to fetch {url}: {e}")
         return None
 
 
+async def afetch_html(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: dict | None = None,
+    timeout: int = 15,
+    raw: bool = False,
+) -> str | bytes | None:
+    """
+    Async variant of fetch_html on a shared aiohttp session. Returns None on failure.
+    With raw=True the undecoded body bytes are returned (for XML parsers).
+    """
+    try:
+        async with session.get(
+            url,
+            headers=_conditional_headers(url, headers),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            if resp.status == 304 and url in _HTTP_CACHE:
+                return _HTTP_CACHE[url]["body"]
+            resp.raise_for_status()
+            body = await resp.read() if raw else await resp.text()
+            _remember_response(url, resp.headers, body)
+            return body
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"[ERROR] Failed to fetch {url}: {e}")
+        return None
+
+
+async def _parse_off_loop(parse_fn, *args):
+    """Run a CPU-bound parse function in the default executor so the event loop stays free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, parse_fn, *args)
+
+
+# Matches Substack/Beehiiv post paths; passed to bs4 as an href filter.
+_P_HREF = re.compile(r"/p/")
+
+
+class SeenIds:
+    """Thread-safe set of article ids already emitted during one scrape cycle."""
+
+    def __init__(self):
+        self._ids: set[str] = set()
+        self._lock = threading.Lock()
+
+    def claim(self, article_id: str) -> bool:
+        """Record `article_id`. Returns False if another scraper already emitted it."""
+        with self._lock:
+            if article_id in self._ids:
+                return False
+            self._ids.add(article_id)
+            return True
+
+
+# Last parse result per URL, keyed by a digest of the body it came from.
+# Archive pages change at most daily, so most cycles re-fetch identical HTML.
+_PARSED_BY_URL: dict[str, tuple[bytes, list[dict]]] = {}
+
+
+def parse_memoized(
+    url: str, body: str | bytes, parse_fn, seen: SeenIds | None = None
+) -> list[dict]:
+    """
+    Return parse_fn(body), reusing the previous result when `body` is
+    byte-identical to the last body parsed for `url`.
+    Cached articles are re-stamped with scraped_at and claimed against `seen`.
+    """
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    hit = _PARSED_BY_URL.get(url)
+    if hit and hit[0] == digest:
+        print(f"[SCRAPER] {url} unchanged — reusing {len(hit[1])} parsed articles")
+        articles = hit[1]
+    else:
+        articles = parse_fn(body)
+        _PARSED_BY_URL[url] = (digest, articles)
+
+    scraped_at = now_iso()
+    return [
+        {**a, "scraped_at": scraped_at}
+        for a in articles
+        if seen is None or seen.claim(a["id"])
+    ]
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+# Reddit entry <content> is a small, regular HTML blob; regexes are enough.
+# First <img> carrying a real src attribute (not data-src etc.), like find("img", src=True)
+_IMG_RE = re.compile(
+    r"""<img\b(?:"[^"]*"|'[^']*'|[^>"'])*?\ssrc\s*=\s*(["'])(.*?)\1""", re.I | re.S
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _iter_atom_entries(body: bytes, limit: int):
+    """
+    Stream up to `limit` Atom <entry> elements from a feed body.
+    Each entry is cleared once the caller moves on, so memory stays flat and
+    nothing past the limit is ever parsed. A truncated or malformed tail ends
+    the stream early rather than raising.
+    """
+    events = etree.iterparse(
+        io.BytesIO(body), events=("end",), tag=_ATOM + "entry", recover=True
+    )
+    try:
+        for count, (_, elem) in enumerate(events, 1):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            if count >= limit:
+                break
+    except etree.XMLSyntaxError as e:
+        print(f"[ERROR] Feed parse stopped early: {e}")
+
+
+def _lexbor_find_parent(node, tags: tuple[str, ...]):
+    """Return the nearest selectolax ancestor whose tag is in `tags`, or None."""
+    node = node.parent
+    while node is not None:
+        if node.tag in tags:
+            return node
+        node = node.parent
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Ben's Bites Scraper (Substack)
 # ---------------------------------------------------------------------------
@@ -49,51 +235,51 @@ class BensBitesScraper:
     SOURCE_DISPLAY = "Ben's Bites"
     ARCHIVE_URL = "https://www.bensbites.com/archive"
     BASE_URL = "https://www.bensbites.com"
+    TAGS = ("AI", "Newsletter")  # shared by every article; a tuple so it can't be mutated
+    _WRAPPER_TAGS = ("div", "article", "section", "tr")
 
-    def scrape(self) -> list[dict]:
+    def scrape(self, seen: SeenIds | None = None) -> list[dict]:
         """Scrape the archive page and return article dicts."""
         print(f"[SCRAPER] Fetching {self.SOURCE_DISPLAY} archive...")
         html = fetch_html(self.ARCHIVE_URL)
         if not html:
             return []
+        return parse_memoized(self.ARCHIVE_URL, html, self.parse, seen)
 
-        soup = BeautifulSoup(html, "html.parser")
+    async def ascrape(
+        self, session: aiohttp.ClientSession, seen: SeenIds | None = None
+    ) -> list[dict]:
+        """Async variant of scrape(): fetch on the loop, parse in the executor."""
+        print(f"[SCRAPER] Fetching {self.SOURCE_DISPLAY} archive...")
+        html = await afetch_html(session, self.ARCHIVE_URL)
+        if not html:
+            return []
+        return await _parse_off_loop(parse_memoized, self.ARCHIVE_URL, html, self.parse, seen)
+
+    def parse(self, html: str) -> list[dict]:
+        """Parse archive page HTML into article dicts."""
+        # Local aliases: these run per link in the hot loop below
+        _clean, _hash = clean_text, hash_url
+        scraped_at = now_iso()
         articles = []
         seen_urls = set()
 
         # Substack archive uses <time datetime="..."> elements alongside
         # post links. We pair them by walking the DOM.
         # Strategy: find all <time> elements, then find the nearest /p/ links.
-        time_elements = soup.find_all("time")
-
-        for time_el in time_elements:
-            # Get the ISO datetime from the <time> element
-            dt_str = time_el.get("datetime")
-            if not dt_str:
-                continue
+        posts = self._iter_posts_lexbor(html) if HAS_SELECTOLAX else self._iter_posts_bs4(html)
 
+        for dt_str, time_text, links in posts:
             try:
                 published_date = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
             except (ValueError, TypeError):
-                published_date = parse_date(time_el.get_text())
-
-            # Walk up to find the containing post wrapper, then find the /p/ link
-            wrapper = time_el.find_parent(["div", "article", "section", "tr"])
-            # If direct parent is too small, go up further
-            for _ in range(5):
-                if wrapper is None:
-                    break
-                links = wrapper.find_all("a", href=lambda h: h and "/p/" in h)
-                if links:
-                    break
-                wrapper = wrapper.parent
+                published_date = parse_date(time_text)
 
-            if not wrapper:
-                continue
+            # Clean each nearby link's text once; reused for title and subtitle
+            cleaned = [(href, _clean(link_text)) for href, link_text in links]
 
             # Process all /p/ links found near this time element
-            for link in wrapper.find_all("a", href=lambda h: h and "/p/" in h):
-                href = link["href"]
+            for href, title in cleaned:
                 if href.startswith("/"):
                     full_url = self.BASE_URL + href
                 elif href.startswith("http"):
@@ -105,22 +291,20 @@ class BensBitesScraper:
                 if full_url in seen_urls:
                     continue
 
-                title = clean_text(link.get_text())
                 if not title or len(title) < 5:
                     continue
                 seen_urls.add(full_url)
+                article_id = _hash(full_url)
 
                 # Look for subtitle text (second link or preview text)
                 subtitle = None
-                all_links = wrapper.find_all("a", href=lambda h: h and "/p/" in h)
-                for other_link in all_links:
-                    other_text = clean_text(other_link.get_text())
+                for _, other_text in cleaned:
                     if other_text and other_text != title and len(other_text) > 10:
                         subtitle = other_text
                         break
 
                 article = {
-                    "id": hash_url(full_url),
+                    "id": article_id,
                     "title": title,
                     "subtitle": subtitle,
                     "url": full_url,
@@ -128,10 +312,10 @@ class BensBitesScraper:
                     "source_display": self.SOURCE_DISPLAY,
                     "author": "Ben Tossell",
                     "published_date": published_date.isoformat() if published_date else None,
-                    "scraped_at": now_iso(),
+                    "scraped_at": scraped_at,
                     "thumbnail": None,
                     "summary": subtitle,
-                    "tags": ["AI", "Newsletter"],
+                    "tags": self.TAGS,
                     "is_new": False,
                 }
                 articles.append(article)
@@ -140,6 +324,71 @@ class BensBitesScraper:
         print(f"[SCRAPER] {self.SOURCE_DISPLAY}: Found {len(articles)} articles")
         return articles
 
+    def _iter_posts_lexbor(self, html: str):
+        """Yield (datetime attr, time text, [(href, link text)]) per <time> via selectolax."""
+        tree = LexborHTMLParser(html)
+        times = []
+        # One document-order pass: collect <time>s and file every /p/ link
+        # under each of its ancestors, so a wrapper's links are a dict lookup.
+        links_under: dict[int, list[tuple[str, str]]] = {}
+        for node in tree.css("time[datetime], a[href*='/p/']"):
+            if node.tag == "time":
+                times.append(node)
+                continue
+            entry = (node.attributes["href"], node.text())
+            ancestor = node.parent
+            while ancestor is not None:
+                links_under.setdefault(ancestor.mem_id, []).append(entry)
+                ancestor = ancestor.parent
+
+        for time_el in times:
+            dt_str = time_el.attributes.get("datetime")
+            if not dt_str:
+                continue
+
+            # Walk up to find the containing post wrapper, then take its /p/ links
+            wrapper = _lexbor_find_parent(time_el, self._WRAPPER_TAGS)
+            # If direct parent is too small, go up further
+            for _ in range(5):
+                if wrapper is None:
+                    break
+                links = links_under.get(wrapper.mem_id)
+                if links:
+                    yield dt_str, time_el.text(), links
+                    break
+                wrapper = wrapper.parent
+
+    def _iter_posts_bs4(self, html: str):
+        """Yield (datetime attr, time text, [(href, link text)]) per <time> via BeautifulSoup."""
+        soup = BeautifulSoup(html, "lxml")
+        times = []
+        links_under: dict[int, list[tuple[str, str]]] = {}
+        for node in soup.find_all(["time", "a"]):
+            if node.name == "time":
+                times.append(node)
+                continue
+            href = node.get("href")
+            if not href or not _P_HREF.search(href):
+                continue
+            entry = (href, node.get_text())
+            for ancestor in node.parents:
+                links_under.setdefault(id(ancestor), []).append(entry)
+
+        for time_el in times:
+            dt_str = time_el.get("datetime")
+            if not dt_str:
+                continue
+
+            wrapper = time_el.find_parent(list(self._WRAPPER_TAGS))
+            for _ in range(5):
+                if wrapper is None:
+                    break
+                links = links_under.get(id(wrapper))
+                if links:
+                    yield dt_str, time_el.get_text(), links
+                    break
+                wrapper = wrapper.parent
+
 
 # ---------------------------------------------------------------------------
 # The Rundown AI Scraper
@@ -151,24 +400,42 @@ class RundownScraper:
     SOURCE_DISPLAY = "The Rundown AI"
     URL = "https://www.therundown.ai/"
     BASE_URL = "https://www.therundown.ai"
+    TAGS = ("AI", "Newsletter")
 
-    def scrape(self) -> list[dict]:
+    def scrape(self, seen: SeenIds | None = None) -> list[dict]:
         """Scrape the homepage and return article dicts."""
         print(f"[SCRAPER] Fetching {self.SOURCE_DISPLAY}...")
         html = fetch_html(self.URL)
         if not html:
             return []
+        return parse_memoized(self.URL, html, self.parse, seen)
 
-        soup = BeautifulSoup(html, "html.parser")
+    async def ascrape(
+        self, session: aiohttp.ClientSession, seen: SeenIds | None = None
+    ) -> list[dict]:
+        """Async variant of scrape(): fetch on the loop, parse in the executor."""
+        print(f"[SCRAPER] Fetching {self.SOURCE_DISPLAY}...")
+        html = await afetch_html(session, self.URL)
+        if not html:
+            return []
+        return await _parse_off_loop(parse_memoized, self.URL, html, self.parse, seen)
+
+    def parse(self, html: str) -> list[dict]:
+        """Parse homepage HTML into article dicts."""
+        # Local aliases: these run per link in the hot loop below
+        _clean, _hash, _trunc = clean_text, hash_url, truncate_summary
+        scraped_at = now_iso()
+        if HAS_SELECTOLAX:
+            links = self._iter_links_lexbor(html)
+            find_thumbnail = self._thumbnail_lexbor
+        else:
+            links = self._iter_links_bs4(html)
+            find_thumbnail = self._thumbnail_bs4
         articles = []
         seen_urls = set()
 
-        # The Rundown: articles are linked with /p/ pattern
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if "/p/" not in href:
-                continue
-
+        # The Rundown: articles are linked with /p/ pattern (filtered by the parser)
+        for href, link_text, link in links:
             if href.startswith("/"):
                 full_url = self.BASE_URL + href
             elif href.startswith("http"):
@@ -183,9 +450,10 @@ class RundownScraper:
             seen_urls.add(full_url)
 
             # Extract title — the link text often contains the full title
-            title_text = clean_text(link.get_text())
+            title_text = _clean(link_text)
             if not title_text or len(title_text) < 10:
                 continue
+            article_id = _hash(full_url)
 
             # Sometimes the link text contains title + subtitle concatenated
             # Try to split smartly
@@ -195,19 +463,14 @@ class RundownScraper:
             # Look for "PLUS:" pattern which separates title from subtitle
             if "PLUS:" in title_text:
                 parts = title_text.split("PLUS:", 1)
-                title = clean_text(parts[0])
-                subtitle = clean_text("PLUS: " + parts[1]) if len(parts) > 1 else None
+                title = _clean(parts[0])
+                subtitle = _clean("PLUS: " + parts[1]) if len(parts) > 1 else None
 
             # Try to find thumbnail image
-            thumbnail = None
-            parent = link.find_parent(["div", "article", "li"])
-            if parent:
-                img = parent.find("img", src=True)
-                if img and "logo" not in img.get("src", "").lower():
-                    thumbnail = img["src"]
+            thumbnail = find_thumbnail(link)
 
             article = {
-                "id": hash_url(full_url),
+                "id": article_id,
                 "title": title,
                 "subtitle": subtitle,
                 "url": full_url,
@@ -215,10 +478,10 @@ class RundownScraper:
                 "source_display": self.SOURCE_DISPLAY,
                 "author": "Rowan Cheung",
                 "published_date": None,  # Homepage doesn't always show dates
-                "scraped_at": now_iso(),
+                "scraped_at": scraped_at,
                 "thumbnail": thumbnail,
-                "summary": subtitle or truncate_summary(title_text),
-                "tags": ["AI", "Newsletter"],
+                "summary": subtitle or _trunc(title_text),
+                "tags": self.TAGS,
                 "is_new": False,
             }
             articles.append(article)
@@ -226,6 +489,39 @@ class RundownScraper:
         print(f"[SCRAPER] {self.SOURCE_DISPLAY}: Found {len(articles)} articles")
         return articles
 
+    def _iter_links_lexbor(self, html: str):
+        """Yield (href, link text, node) for every /p/ link via selectolax."""
+        tree = LexborHTMLParser(html)
+        for link in tree.css("a[href*='/p/']"):
+            yield link.attributes["href"], link.text(), link
+
+    def _iter_links_bs4(self, html: str):
+        """Yield (href, link text, tag) for every /p/ link via BeautifulSoup."""
+        soup = BeautifulSoup(html, "lxml")
+        for link in soup.find_all("a", href=_P_HREF):
+            yield link["href"], link.get_text(), link
+
+    @staticmethod
+    def _thumbnail_lexbor(link) -> str | None:
+        """Return the first non-logo <img src> in the link's card, if any."""
+        parent = _lexbor_find_parent(link, ("div", "article", "li"))
+        if parent:
+            img = parent.css_first("img[src]")
+            src = img.attributes.get("src") if img else None
+            if src and "logo" not in src.lower():
+                return src
+        return None
+
+    @staticmethod
+    def _thumbnail_bs4(link) -> str | None:
+        """Return the first non-logo <img src> in the link's card, if any."""
+        parent = link.find_parent(["div", "article", "li"])
+        if parent:
+            img = parent.find("img", src=True)
+            if img and "logo" not in img.get("src", "").lower():
+                return img["src"]
+        return None
+
 
 # ---------------------------------------------------------------------------
 # Reddit AI Scraper
@@ -236,19 +532,28 @@ class RedditScraper:
     SOURCE = "reddit"
     SOURCE_DISPLAY = "Reddit AI"
     SUBREDDITS = ["artificial", "MachineLearning", "singularity"]
+    MAX_ENTRIES = 20
+    RSS_HEADERS = {
+        "User-Agent": "Glaido-AI-Aggregator/1.0 (educational project)",
+        "Accept": "application/atom+xml,application/xml,text/xml",
+    }
 
-    def scrape(self) -> list[dict]:
+    def scrape(self, seen: SeenIds | None = None) -> list[dict]:
         """Scrape recent posts from AI subreddits via RSS feeds."""
         print(f"[SCRAPER] Fetching {self.SOURCE_DISPLAY} ({', '.join(self.SUBREDDITS)})...")
+        seen = seen or SeenIds()
         articles = []
-        seen_urls = set()
 
-        for subreddit in self.SUBREDDITS:
+        # Fetch feeds concurrently; collect in subreddit order so dedup stays stable.
+        futures = [
+            (subreddit, _FEED_POOL.submit(self._fetch_subreddit, subreddit))
+            for subreddit in self.SUBREDDITS
+        ]
+        for subreddit, future in futures:
             try:
-                posts = self._fetch_subreddit(subreddit)
+                posts = future.result()
                 for post in posts:
-                    if post["url"] not in seen_urls:
-                        seen_urls.add(post["url"])
+                    if seen.claim(post["id"]):
                         articles.append(post)
             except Exception as e:
                 print(f"[ERROR] Reddit r/{subreddit} failed: {e}")
@@ -256,90 +561,109 @@ class RedditScraper:
         print(f"[SCRAPER] {self.SOURCE_DISPLAY}: Found {len(articles)} posts")
         return articles
 
+    async def ascrape(
+        self, session: aiohttp.ClientSession, seen: SeenIds | None = None
+    ) -> list[dict]:
+        """Async variant of scrape(): all subreddit feeds are fetched concurrently."""
+        print(f"[SCRAPER] Fetching {self.SOURCE_DISPLAY} ({', '.join(self.SUBREDDITS)})...")
+        results = await asyncio.gather(
+            *[self._afetch_subreddit(session, sub) for sub in self.SUBREDDITS],
+            return_exceptions=True,
+        )
+        seen = seen or SeenIds()
+        articles = []
+
+        for subreddit, posts in zip(self.SUBREDDITS, results):
+            if isinstance(posts, Exception):
+                print(f"[ERROR] Reddit r/{subreddit} failed: {posts}")
+                continue
+            for post in posts:
+                if seen.claim(post["id"]):
+                    articles.append(post)
+
+        print(f"[SCRAPER] {self.SOURCE_DISPLAY}: Found {len(articles)} posts")
+        return articles
+
     def _fetch_subreddit(self, subreddit: str) -> list[dict]:
         """Fetch posts from a subreddit via the public Atom RSS feed."""
         url = f"https://www.reddit.com/r/{subreddit}/.rss"
-        headers = {
-            "User-Agent": "Glaido-AI-Aggregator/1.0 (educational project)",
-            "Accept": "application/atom+xml,application/xml,text/xml",
-        }
-
-        try:
-            resp = requests.get(url, headers=headers, timeout=15)
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            print(f"[ERROR] Reddit r/{subreddit} RSS: {e}")
+        body = fetch_html(url, headers=self.RSS_HEADERS, raw=True)
+        if not body:
             return []
+        return parse_memoized(url, body, partial(self._parse_feed, subreddit))
 
-        try:
-            soup = BeautifulSoup(resp.text, "xml")
-        except Exception:
-            soup = BeautifulSoup(resp.text, "html.parser")
-        entries = soup.find_all("entry")
+    async def _afetch_subreddit(self, session: aiohttp.ClientSession, subreddit: str) -> list[dict]:
+        """Async variant of _fetch_subreddit."""
+        url = f"https://www.reddit.com/r/{subreddit}/.rss"
+        body = await afetch_html(session, url, headers=self.RSS_HEADERS, raw=True)
+        if not body:
+            return []
+        return await _parse_off_loop(
+            parse_memoized, url, body, partial(self._parse_feed, subreddit)
+        )
+
+    def _parse_feed(self, subreddit: str, body: bytes) -> list[dict]:
+        """Parse an Atom feed body into article dicts, stopping after MAX_ENTRIES entries."""
+        # Local aliases: these run per entry in the loop below
+        _clean, _hash, _trunc = clean_text, hash_url, truncate_summary
+        scraped_at = now_iso()
+        # One shared tags tuple per feed, with the subreddit tag interned
+        tags = ("AI", "Reddit", sys.intern(f"r/{subreddit}"))
         articles = []
-
-        for entry in entries[:20]:
+        for entry in _iter_atom_entries(body, self.MAX_ENTRIES):
             # Title
-            title_el = entry.find("title")
-            if not title_el:
-                continue
-            title = clean_text(title_el.get_text())
+            title = _clean(entry.findtext(_ATOM + "title"))
             if not title or len(title) < 10:
                 continue
 
             # URL (link element)
-            link_el = entry.find("link")
-            post_url = link_el.get("href", "") if link_el else ""
+            link_el = entry.find(_ATOM + "link")
+            post_url = link_el.get("href", "") if link_el is not None else ""
             if not post_url:
                 continue
             post_url = post_url.split("?")[0]
 
             # Published date
-            updated_el = entry.find("updated")
+            updated = entry.findtext(_ATOM + "updated")
             published_date = None
-            if updated_el:
+            if updated:
                 try:
                     published_date = datetime.fromisoformat(
-                        updated_el.get_text().strip().replace("Z", "+00:00")
+                        updated.strip().replace("Z", "+00:00")
                     )
                 except (ValueError, TypeError):
                     pass
 
             # Author
             author_name = "unknown"
-            author_el = entry.find("author")
-            if author_el:
-                name_el = author_el.find("name")
-                if name_el:
-                    author_name = name_el.get_text().strip().lstrip("/u/")
+            name = entry.findtext(f"{_ATOM}author/{_ATOM}name")
+            if name is not None:
+                author_name = name.strip().lstrip("/u/")
 
             # Content / summary — extract thumbnail and text preview from HTML content
             thumbnail = None
             summary_text = ""
-            content_el = entry.find("content")
-            if content_el:
-                content_html = content_el.get_text()
-                content_soup = BeautifulSoup(content_html, "html.parser")
-
+            content_html = entry.findtext(_ATOM + "content")
+            if content_html is not None:
                 # Look for images
-                img = content_soup.find("img", src=True)
-                if img and img["src"].startswith("http"):
-                    thumbnail = img["src"]
+                m = _IMG_RE.search(content_html)
+                if m and m.group(2).startswith("http"):
+                    thumbnail = unescape(m.group(2))
 
                 # Get text preview
-                text = content_soup.get_text(separator=" ", strip=True)
-                summary_text = truncate_summary(text, 200) if text else ""
+                text = " ".join(unescape(_TAG_RE.sub(" ", content_html)).split())
+                summary_text = _trunc(text, 200) if text else ""
 
             # Category tag (flair)
-            category_el = entry.find("category")
-            flair = category_el.get("label", "") if category_el else ""
+            category_el = entry.find(_ATOM + "category")
+            flair = category_el.get("label", "") if category_el is not None else ""
 
             subtitle = f"r/{subreddit}"
             if flair:
                 subtitle += f" \u00b7 {flair}"
 
             articles.append({
-                "id": hash_url(post_url),
+                "id": _hash(post_url),
                 "title": title,
                 "subtitle": subtitle,
                 "url": post_url,
@@ -347,10 +671,10 @@ class RedditScraper:
                 "source_display": self.SOURCE_DISPLAY,
                 "author": f"u/{author_name}",
                 "published_date": published_date.isoformat() if published_date else None,
-                "scraped_at": now_iso(),
+                "scraped_at": scraped_at,
                 "thumbnail": thumbnail,
                 "summary": summary_text or subtitle,
-                "tags": ["AI", "Reddit", f"r/{subreddit}"],
+                "tags": tags,
                 "is_new": False,
             })
 
@@ -367,19 +691,65 @@ SCRAPERS = {
 }
 
 
+# Scraper tasks run on _POOL. Reddit's per-subreddit fetches go to their own
+# _FEED_POOL, which only runs leaf fetches that never wait on other futures,
+# so a scraper blocked on its feeds can't deadlock even when several
+# scrape_all() calls overlap and fill _POOL.
+_POOL = ThreadPoolExecutor(max_workers=len(SCRAPERS), thread_name_prefix="scraper")
+_FEED_POOL = ThreadPoolExecutor(
+    max_workers=len(RedditScraper.SUBREDDITS), thread_name_prefix="reddit-feed"
+)
+
+
 def scrape_all() -> list[dict]:
-    """Run all scrapers and return combined article list."""
+    """Run all scrapers concurrently and return combined article list."""
     all_articles = []
-    for name, scraper_cls in SCRAPERS.items():
+    seen = SeenIds()  # cross-scraper dedup for this cycle
+    futures = {
+        _POOL.submit(scraper_cls().scrape, seen): name for name, scraper_cls in SCRAPERS.items()
+    }
+    for future in as_completed(futures):
+        name = futures[future]
         try:
-            scraper = scraper_cls()
-            articles = scraper.scrape()
-            all_articles.extend(articles)
+            all_articles.extend(future.result())
         except Exception as e:
             print(f"[ERROR] Scraper '{name}' failed: {e}")
     return all_articles
 
 
+async def scrape_all_async() -> list[dict]:
+    """Async variant of scrape_all(): every source shares one pooled aiohttp session."""
+    connector = aiohttp.TCPConnector(limit_per_host=6)
+    seen = SeenIds()  # cross-scraper dedup for this cycle
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        results = await asyncio.gather(
+            *[scraper_cls().ascrape(session, seen) for scraper_cls in SCRAPERS.values()],
+            return_exceptions=True,
+        )
+
+    all_articles = []
+    for name, articles in zip(SCRAPERS, results):
+        if isinstance(articles, Exception):
+            print(f"[ERROR] Scraper '{name}' failed: {articles}")
+            continue
+        all_articles.extend(articles)
+    return all_articles
+
+
+async def scrape_source_async(source: str) -> list[dict]:
+    """Async variant of scrape_source()."""
+    scraper_cls = SCRAPERS.get(source)
+    if not scraper_cls:
+        print(f"[ERROR] Unknown source: {source}")
+        return []
+    try:
+        async with aiohttp.ClientSession(headers=HEADERS) as session:
+            return await scraper_cls().ascrape(session)
+    except Exception as e:
+        print(f"[ERROR] Scraper '{source}' failed: {e}")
+        return []
+
+
 def scrape_source(source: str) -> list[dict]:
     """Run a specific scraper by source key."""
     scraper_cls = SCRAPERS.get(source)
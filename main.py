@@ -8,23 +8,28 @@ Phase 3 Layer 2: Management (Decision Making)
 - Serves the static frontend dashboard
 """
 
+import asyncio
 import os
 import sys
-from datetime import datetime, timezone
+import threading
+import time
 from contextlib import asynccontextmanager
 
+import orjson
+
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 
-from core_logic import scrape_all, scrape_source, SCRAPERS
-from tools import now_iso, ensure_data_dir
+from core_logic import scrape_all, scrape_all_async, scrape_source_async, SCRAPERS
+from tools import Article, MergeIndex, now_iso, ensure_data_dir, mark_new_articles
 from supabase_store import (
     load_articles, save_articles, merge_articles,
     load_saved_ids, save_bookmark, remove_bookmark,
     get_saved_article_ids,
-    load_scrape_state, save_scrape_state,
+    load_scrape_state, save_scrape_state, save_scrape_state_async,
+    load_dashboard_bundle,
     check_connection,
 )
 
@@ -42,20 +47,122 @@ if sys.platform == "win32":
 
 IS_SERVERLESS = bool(os.environ.get("VERCEL") or os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
 
+# ---------------------------------------------------------------------------
+# Read Cache (short TTL over Supabase round-trips)
+# ---------------------------------------------------------------------------
+CACHE_TTL_SECONDS = 30
+_read_cache: dict[str, tuple[float, object]] = {}
+
+
+def _cached(key: str, loader):
+    """Return loader() memoized under `key` for CACHE_TTL_SECONDS."""
+    now = time.monotonic()
+    hit = _read_cache.get(key)
+    if hit and now - hit[0] < CACHE_TTL_SECONDS:
+        return hit[1]
+    value = loader()
+    _read_cache[key] = (now, value)
+    return value
+
+
+def invalidate_cache(*keys: str):
+    """Drop the given cache keys (or everything when called with no keys)."""
+    for key in keys or list(_read_cache):
+        _read_cache.pop(key, None)
+
+
+class ArticleIndex:
+    """A loaded article list (as slotted Article records) plus O(1) lookups by id and by source."""
+
+    def __init__(self, rows: list[dict]):
+        # is_new is recomputed once per cache fill, so it ages out even where
+        # no scheduler runs (serverless, or APScheduler not installed)
+        mark_new_articles(rows)
+        self.all_list = [Article.from_row(r) for r in rows]
+        self.by_id: dict[str, Article] = {}
+        self.by_source: dict[str, list[Article]] = {}
+        for a in self.all_list:
+            self.by_id[a.id] = a
+            self.by_source.setdefault(a.source, []).append(a)
+
+    def lookup(self, ids) -> list[Article]:
+        """Return the indexed articles for `ids`, in the given order, skipping unknown ids."""
+        by_id = self.by_id
+        return [by_id[i] for i in ids if i in by_id]
+
+
+def cached_articles() -> ArticleIndex:
+    """Indexed articles from Supabase, cached for CACHE_TTL_SECONDS."""
+    return _cached("articles", lambda: ArticleIndex(load_articles()))
+
+
+def cached_saved_ids() -> list[dict]:
+    """Bookmark entries from Supabase, cached for CACHE_TTL_SECONDS."""
+    return _cached("saved_ids", load_saved_ids)
+
+
+def cached_scrape_state() -> dict:
+    """Scrape state from Supabase, cached for CACHE_TTL_SECONDS."""
+    return _cached("scrape_state", load_scrape_state)
+
+
+_DASHBOARD_KEYS = ("articles", "saved_ids", "scrape_state")
+
+
+def cached_dashboard() -> tuple[ArticleIndex, list[dict], dict]:
+    """
+    Articles, bookmarks and scrape state for /api/articles.
+    If any of the three is cold, all are refilled with one bundle RPC
+    instead of up to three separate Supabase reads.
+    """
+    now = time.monotonic()
+    hits = [_read_cache.get(key) for key in _DASHBOARD_KEYS]
+    if all(hit and now - hit[0] < CACHE_TTL_SECONDS for hit in hits):
+        return tuple(hit[1] for hit in hits)
+
+    bundle = load_dashboard_bundle()
+    values = (ArticleIndex(bundle["articles"]), bundle["saved_ids"], bundle["state"])
+    for key, value in zip(_DASHBOARD_KEYS, values):
+        _read_cache[key] = (now, value)
+    return values
+
+
 # ---------------------------------------------------------------------------
 # Scheduler Setup (skipped in serverless)
 # ---------------------------------------------------------------------------
 scheduler = BackgroundScheduler() if HAS_SCHEDULER and not IS_SERVERLESS else None
 
 
+# One long-lived merge index for scrape cycles, seeded from Supabase on first
+# use; merge_articles updates and prunes it in place instead of re-indexing.
+_merge_index: MergeIndex | None = None
+_merge_lock = threading.Lock()
+
+
+def merge_scraped(new_articles: list[dict]) -> list[dict]:
+    """
+    Flag, merge and persist a scrape's articles through the shared MergeIndex.
+    New articles are flagged before the merge so its upsert writes the right
+    is_new; existing rows are only rewritten when their flag aged out.
+    """
+    global _merge_index
+    with _merge_lock:
+        if _merge_index is None:
+            _merge_index = MergeIndex(load_articles())
+        mark_new_articles(new_articles)
+        merged = merge_articles(_merge_index, new_articles, return_merged=True)
+        aged = mark_new_articles(merged)
+        if aged:
+            save_articles(aged)
+        return merged
+
+
 def scheduled_scrape():
     """Background job: scrape all sources and merge into storage."""
     print(f"\n[SCHEDULER] Running scrape cycle at {now_iso()}")
     try:
         new_articles = scrape_all()
-        existing = load_articles()
-        merged = merge_articles(existing, new_articles)
-        save_articles(merged)
+        merged = merge_scraped(new_articles)
 
         # Update scrape state
         state = load_scrape_state()
@@ -69,11 +176,27 @@ def scheduled_scrape():
                 "error_message": None,
             }
         save_scrape_state(state)
+        invalidate_cache()
         print(f"[SCHEDULER] Scrape complete. {len(new_articles)} new, {len(merged)} total.")
     except Exception as e:
         print(f"[SCHEDULER] Scrape failed: {e}")
 
 
+def refresh_new_flags():
+    """
+    Background job: persist is_new for stored articles that aged out of the 24h window.
+    Reads don't depend on it (ArticleIndex recomputes the flag); this keeps the table in sync.
+    """
+    try:
+        changed = mark_new_articles(load_articles())
+        if changed:
+            save_articles(changed)
+            invalidate_cache("articles")
+        print(f"[SCHEDULER] is_new refreshed. {len(changed)} articles changed.")
+    except Exception as e:
+        print(f"[SCHEDULER] is_new refresh failed: {e}")
+
+
 # ---------------------------------------------------------------------------
 # App Lifespan (startup / shutdown)
 # ---------------------------------------------------------------------------
@@ -90,13 +213,14 @@ async def lifespan(app: FastAPI):
 
     if not IS_SERVERLESS and scheduler:
         # Run initial scrape if no data exists
-        existing = load_articles()
+        existing = load_articles(columns=["id"])
         if not existing:
             print("[STARTUP] No articles found. Running initial scrape...")
             scheduled_scrape()
 
         # Start the 24-hour scheduler
         scheduler.add_job(scheduled_scrape, "interval", hours=24, id="scrape_cycle")
+        scheduler.add_job(refresh_new_flags, "cron", minute=0, id="refresh_is_new")
         scheduler.start()
         print("[STARTUP] Scheduler started — scraping every 24 hours.")
     else:
@@ -113,11 +237,19 @@ async def lifespan(app: FastAPI):
 # ---------------------------------------------------------------------------
 # FastAPI App
 # ---------------------------------------------------------------------------
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (handles Article records natively)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
 app = FastAPI(
     title="Glaido AI News Aggregator",
     description="Scrapes and serves AI newsletter articles",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -137,35 +269,19 @@ async def get_articles(source: str | None = Query(None), saved: bool = Query(Fal
     Return all scraped articles.
     Optional filters: ?source=bens_bites  ?saved=true
     """
-    articles = load_articles()
-
-    if source:
-        articles = [a for a in articles if a["source"] == source]
+    index, saved_entries, state = cached_dashboard()
+    saved_id_list = [s["article_id"] for s in saved_entries]
 
     if saved:
-        saved_entries = load_saved_ids()
-        saved_id_set = {s["article_id"] for s in saved_entries}
-        articles = [a for a in articles if a["id"] in saved_id_set]
-
-    # Calculate is_new for each article
-    now = datetime.now(timezone.utc)
-    for a in articles:
-        if a.get("published_date"):
-            try:
-                pub = datetime.fromisoformat(a["published_date"])
-                if pub.tzinfo is None:
-                    pub = pub.replace(tzinfo=timezone.utc)
-                a["is_new"] = (now - pub).total_seconds() < 86400
-            except (ValueError, TypeError):
-                a["is_new"] = False
-        else:
-            a["is_new"] = False
-
-    saved_entries = load_saved_ids()
-    saved_id_list = [s["article_id"] for s in saved_entries]
-    state = load_scrape_state()
+        articles = index.lookup(saved_id_list)
+        if source:
+            articles = [a for a in articles if a.source == source]
+    elif source:
+        articles = index.by_source.get(source, [])
+    else:
+        articles = index.all_list
 
-    return {
+    return ORJSONResponse({
         "articles": articles,
         "saved_ids": saved_id_list,
         "last_updated": now_iso(),
@@ -177,17 +293,15 @@ async def get_articles(source: str | None = Query(None), saved: bool = Query(Fal
             }
             for key in SCRAPERS
         ],
-    }
+    })
 
 
 @app.get("/api/articles/saved")
 async def get_saved_articles():
     """Return saved/bookmarked articles."""
-    saved_entries = load_saved_ids()
-    saved_id_set = {s["article_id"] for s in saved_entries}
-    articles = load_articles()
-    saved_articles = [a for a in articles if a["id"] in saved_id_set]
-    return {"articles": saved_articles, "saved_ids": list(saved_id_set)}
+    saved_id_list = [s["article_id"] for s in cached_saved_ids()]
+    saved_articles = cached_articles().lookup(saved_id_list)
+    return ORJSONResponse({"articles": saved_articles, "saved_ids": saved_id_list})
 
 
 @app.post("/api/articles/save")
@@ -195,6 +309,7 @@ async def save_article(req: SaveArticleRequest):
     """Bookmark an article via Supabase."""
     try:
         result = save_bookmark(req.article_id)
+        invalidate_cache("saved_ids")
         return {"status": "saved", "article_id": req.article_id}
     except Exception as e:
         return {"status": "already_saved", "article_id": req.article_id}
@@ -205,6 +320,7 @@ async def unsave_article(article_id: str):
     """Remove bookmark via Supabase."""
     try:
         remove_bookmark(article_id)
+        invalidate_cache("saved_ids")
         return {"status": "unsaved", "article_id": article_id}
     except Exception as e:
         raise HTTPException(status_code=404, detail="Article not saved")
@@ -216,16 +332,15 @@ async def trigger_scrape(source: str | None = Query(None)):
     if source:
         if source not in SCRAPERS:
             raise HTTPException(status_code=400, detail=f"Unknown source: {source}")
-        new_articles = scrape_source(source)
+        new_articles = await scrape_source_async(source)
     else:
-        new_articles = scrape_all()
+        new_articles = await scrape_all_async()
 
-    existing = load_articles()
-    merged = merge_articles(existing, new_articles)
-    save_articles(merged)
+    # Supabase reads/writes and the SimHash merge run off the event loop
+    merged = await asyncio.to_thread(merge_scraped, new_articles)
 
     # Update state
-    state = load_scrape_state()
+    state = await asyncio.to_thread(load_scrape_state)
     sources_scraped = {source} if source else set(SCRAPERS.keys())
     for src in sources_scraped:
         src_articles = [a for a in new_articles if a["source"] == src]
@@ -236,7 +351,8 @@ async def trigger_scrape(source: str | None = Query(None)):
             "status": "success" if src_articles else "no_new",
             "error_message": None,
         }
-    save_scrape_state(state)
+    await save_scrape_state_async(state)
+    invalidate_cache()
 
     return {
         "status": "complete",
@@ -248,10 +364,10 @@ async def trigger_scrape(source: str | None = Query(None)):
 @app.get("/api/status")
 async def get_status():
     """Return scraper health & last-run status per source."""
-    state = load_scrape_state()
-    articles = load_articles()
+    state = cached_scrape_state()
+    index = cached_articles()
     return {
-        "total_articles": len(articles),
+        "total_articles": len(index.all_list),
         "sources": {
             key: state.get(key, {"status": "never_run", "last_scraped_at": None})
             for key in SCRAPERS
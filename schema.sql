@@ -53,3 +53,29 @@ CREATE POLICY "Allow all access to scrape_state" ON scrape_state FOR ALL USING (
 CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
 CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_date DESC);
 CREATE INDEX IF NOT EXISTS idx_saved_article_id ON saved_articles(article_id);
+
+-- 6. Dashboard bundle RPC: articles + bookmarks + scrape state in one call
+--    (POST /rest/v1/rpc/get_dashboard_bundle {"source": null, "saved": false})
+CREATE OR REPLACE FUNCTION get_dashboard_bundle(source TEXT DEFAULT NULL, saved BOOLEAN DEFAULT FALSE)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'articles', COALESCE((
+            SELECT jsonb_agg(to_jsonb(a) ORDER BY a.published_date DESC NULLS LAST)
+            FROM (
+                SELECT * FROM articles
+                WHERE (get_dashboard_bundle.source IS NULL OR articles.source = get_dashboard_bundle.source)
+                  AND (NOT get_dashboard_bundle.saved OR articles.id IN (SELECT article_id FROM saved_articles))
+                ORDER BY published_date DESC NULLS LAST
+                LIMIT 200
+            ) a
+        ), '[]'::jsonb),
+        'saved_ids', COALESCE((
+            SELECT jsonb_agg(to_jsonb(s) ORDER BY s.saved_at DESC) FROM saved_articles s
+        ), '[]'::jsonb),
+        'state', COALESCE((
+            SELECT jsonb_agg(to_jsonb(st)) FROM scrape_state st
+        ), '[]'::jsonb)
+    );
+$$;
@@ -8,10 +8,34 @@ Per B.L.A.S.T. Data-First Rule: this module implements the exact same
 interface as the JSON storage functions in tools.py.
 """
 
+import asyncio
 import os
+import threading
+import time
+import httpx
 import requests
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from itertools import islice
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tools import MERGE_LIMIT, MergeIndex, newest_first
+
+# orjson decodes/encodes straight from/to bytes on a C path; stdlib json is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(obj).encode("utf-8")
 
 load_dotenv()
 
@@ -29,113 +53,302 @@ HEADERS = {
     "apikey": SUPABASE_KEY,
     "Authorization": f"Bearer {SUPABASE_KEY}",
     "Content-Type": "application/json",
-    "Prefer": "return=representation",
+    # Writes echo nothing back unless a caller opts in (see _prefer_headers)
+    "Prefer": "return=minimal",
 }
 
 REST_URL = f"{SUPABASE_URL}/rest/v1"
 
+# One pooled keep-alive session for every REST call, so repeated calls skip
+# the TCP+TLS handshake. Idempotent requests retry on transient gateway errors.
+# Its default Accept-Encoding (gzip, deflate) already gets compressed responses.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
 
 # ---------------------------------------------------------------------------
 # Low-level REST helpers
 # ---------------------------------------------------------------------------
+# (table, sorted params) -> (ETag, rows) from the last 200 response that had an ETag
+_etag_cache: dict[tuple, tuple[str, bytes]] = {}
+
+
 def _get(table: str, params: dict = None) -> list[dict]:
-    """GET rows from a Supabase table."""
-    resp = requests.get(f"{REST_URL}/{table}", headers=HEADERS, params=params or {})
+    """
+    GET rows from a Supabase table.
+    Sends If-None-Match when an earlier response carried an ETag and reuses
+    the cached body on 304. The body is kept as bytes and decoded per call,
+    so callers always get fresh dicts they are free to mutate.
+    """
+    params = params or {}
+    key = (table, tuple(sorted(params.items())))
+    cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    resp = _SESSION.get(f"{REST_URL}/{table}", params=params, headers=headers)
+    if resp.status_code == 304 and cached:
+        return _json_loads(cached[1])
     resp.raise_for_status()
-    return resp.json()
+    etag = resp.headers.get("ETag")
+    if etag:
+        _etag_cache[key] = (etag, resp.content)
+    return _json_loads(resp.content)
+
+
+_HEADERS_COUNT_NONE = {"Prefer": "count=none"}
 
 
-def _post(table: str, data: list[dict] | dict, upsert: bool = False) -> list[dict]:
-    """POST (insert) rows into a Supabase table. Supports upsert."""
-    headers = {**HEADERS}
+def _head(table: str, params: dict = None) -> requests.Response:
+    """HEAD a Supabase table: status and headers only, no rows are sent back."""
+    return _SESSION.head(f"{REST_URL}/{table}", params=params, headers=_HEADERS_COUNT_NONE)
+
+
+# Per-request Prefer overrides, built once: the clients merge them over their
+# default HEADERS without copying or mutating these dicts.
+_HEADERS_REPRESENTATION = {"Prefer": "return=representation"}
+_HEADERS_UPSERT = {"Prefer": "return=representation,resolution=merge-duplicates"}
+_HEADERS_UPSERT_MINIMAL = {"Prefer": "return=minimal,resolution=merge-duplicates"}
+
+
+def _prefer_headers(upsert: bool, minimal: bool) -> dict | None:
+    """Per-request Prefer override for a write (None keeps the return=minimal default)."""
     if upsert:
-        headers["Prefer"] = "return=representation,resolution=merge-duplicates"
-    resp = requests.post(f"{REST_URL}/{table}", headers=headers, json=data)
+        return _HEADERS_UPSERT_MINIMAL if minimal else _HEADERS_UPSERT
+    return None if minimal else _HEADERS_REPRESENTATION
+
+
+def _post(
+    table: str,
+    data: list[dict] | dict,
+    upsert: bool = False,
+    params: dict = None,
+    minimal: bool = True,
+) -> list[dict]:
+    """
+    POST (insert) rows into a Supabase table. Supports upsert.
+    Returns the written rows with minimal=False, else [] (nothing is echoed back).
+    """
+    resp = _SESSION.post(
+        f"{REST_URL}/{table}",
+        headers=_prefer_headers(upsert, minimal),
+        data=_json_dumps(data),
+        params=params,
+    )
     resp.raise_for_status()
-    return resp.json()
+    return _json_loads(resp.content) if resp.content else []
 
 
 def _delete(table: str, params: dict) -> bool:
     """DELETE rows from a Supabase table using query params as filters."""
-    resp = requests.delete(f"{REST_URL}/{table}", headers=HEADERS, params=params)
+    resp = _SESSION.delete(f"{REST_URL}/{table}", params=params)
     resp.raise_for_status()
     return True
 
 
-def _patch(table: str, data: dict, params: dict) -> list[dict]:
-    """PATCH (update) rows in a Supabase table."""
-    resp = requests.patch(f"{REST_URL}/{table}", headers=HEADERS, json=data, params=params)
+def _patch(table: str, data: dict, params: dict, minimal: bool = True) -> list[dict]:
+    """PATCH (update) rows in a Supabase table. Returns them with minimal=False, else []."""
+    resp = _SESSION.patch(
+        f"{REST_URL}/{table}",
+        headers=_prefer_headers(False, minimal),
+        data=_json_dumps(data),
+        params=params,
+    )
+    resp.raise_for_status()
+    return _json_loads(resp.content) if resp.content else []
+
+
+def _async_client() -> httpx.AsyncClient:
+    """New HTTP/2 client for concurrent writes. Bound to the event loop it is first used on."""
+    return httpx.AsyncClient(
+        http2=True, headers=HEADERS, limits=httpx.Limits(max_connections=20), timeout=30
+    )
+
+
+# Sync callers run their writes on one long-lived background event loop, so a
+# single pooled HTTP/2 client (and its TLS connection) is reused across saves.
+_writer_loop: asyncio.AbstractEventLoop | None = None
+_writer_client: httpx.AsyncClient | None = None  # only touched from _writer_loop
+_writer_lock = threading.Lock()
+
+
+def _get_writer_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) the background event loop that runs sync-initiated writes."""
+    global _writer_loop
+    with _writer_lock:
+        if _writer_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="supabase-writer", daemon=True).start()
+            _writer_loop = loop
+    return _writer_loop
+
+
+@asynccontextmanager
+async def _write_client():
+    """
+    Yield an httpx client for writes: the long-lived one on the writer loop,
+    or a throwaway client when awaited directly on some other event loop.
+    """
+    global _writer_client
+    if asyncio.get_running_loop() is _writer_loop:
+        if _writer_client is None:
+            _writer_client = _async_client()
+        yield _writer_client
+    else:
+        async with _async_client() as client:
+            yield client
+
+
+async def _apost(
+    client: httpx.AsyncClient,
+    table: str,
+    data: list[dict] | dict,
+    upsert: bool = False,
+    minimal: bool = True,
+) -> list[dict]:
+    """
+    Async variant of _post on a shared httpx.AsyncClient.
+    Returns the written rows with minimal=False, else [] (nothing is echoed back).
+    """
+    resp = await client.post(
+        f"{REST_URL}/{table}",
+        headers=_prefer_headers(upsert, minimal),
+        content=_json_dumps(data),
+    )
+    resp.raise_for_status()
+    return _json_loads(resp.content) if resp.content else []
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion from sync code on the shared writer loop.
+    Works whether or not the calling thread has its own running event loop
+    (e.g. called from an async endpoint). Exceptions propagate to the caller.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_writer_loop()).result()
+
+
+def _rpc(function: str, params: dict) -> dict | list:
+    """Call a Postgres function exposed by PostgREST at /rpc/<function>."""
+    resp = _SESSION.post(
+        f"{REST_URL}/rpc/{function}",
+        headers=_prefer_headers(False, minimal=False),
+        data=_json_dumps(params),
+    )
     resp.raise_for_status()
-    return resp.json()
+    return _json_loads(resp.content)
 
 
 # ---------------------------------------------------------------------------
 # Articles
 # ---------------------------------------------------------------------------
-def load_articles(source: str = None) -> list[dict]:
-    """Load all articles, optionally filtered by source. Sorted by published_date DESC."""
+def load_articles(source: str = None, columns: list[str] | None = None) -> list[dict]:
+    """
+    Load all articles, optionally filtered by source. Sorted by published_date DESC.
+    columns projects the rows server-side (PostgREST select=); default is every column.
+    Projected rows are partial, so never pass them back to save_articles.
+    """
     params = {"order": "published_date.desc.nullslast", "limit": "200"}
     if source:
         params["source"] = f"eq.{source}"
-    rows = _get("articles", params)
-    # Convert tags from Postgres array to Python list if needed
-    for r in rows:
-        if isinstance(r.get("tags"), str):
-            r["tags"] = [t.strip() for t in r["tags"].strip("{}").split(",") if t.strip()]
-    return rows
+    if columns:
+        params["select"] = ",".join(columns)
+    # tags is TEXT[] (schema.sql), which PostgREST already returns as a JSON array
+    return _get("articles", params)
+
+
+# Article columns copied as-is; tags and is_new get defaults in _article_row
+_FIELDS = (
+    "id", "title", "subtitle", "url", "source", "source_display", "author",
+    "published_date", "scraped_at", "thumbnail", "summary",
+)
+_EMPTY_TUPLE = ()  # shared tags default; encodes as [] like a fresh list would
+
 
+def _article_row(a: dict) -> dict:
+    """Project an article onto the articles table columns."""
+    row = {k: a.get(k) for k in _FIELDS}
+    row["tags"] = a.get("tags") or _EMPTY_TUPLE
+    row["is_new"] = a.get("is_new", False)
+    return row
 
-def save_articles(articles: list[dict]):
-    """Upsert articles into Supabase (insert new, update existing by id)."""
+
+def save_articles(articles: list[dict], minimal: bool = True):
+    """
+    Upsert articles into Supabase (insert new, update existing by id).
+    minimal=False asks the server to send the upserted rows back.
+    """
+    _run_sync(save_articles_async(articles, minimal))
+
+
+UPSERT_CONCURRENCY = 8  # article batches in flight at once, to bound load on Supabase
+
+
+async def save_articles_async(articles: list[dict], minimal: bool = True):
+    """Async variant of save_articles: batches are upserted concurrently (bounded)."""
     if not articles:
         return
-    # Clean data for Supabase
-    clean = []
-    for a in articles:
-        row = {
-            "id": a["id"],
-            "title": a.get("title"),
-            "subtitle": a.get("subtitle"),
-            "url": a.get("url"),
-            "source": a.get("source"),
-            "source_display": a.get("source_display"),
-            "author": a.get("author"),
-            "published_date": a.get("published_date"),
-            "scraped_at": a.get("scraped_at"),
-            "thumbnail": a.get("thumbnail"),
-            "summary": a.get("summary"),
-            "tags": a.get("tags", []),
-            "is_new": a.get("is_new", False),
-        }
-        clean.append(row)
-
-    # Upsert in batches of 50 (Supabase limit safety)
+    # Upsert in batches of 50 (Supabase limit safety), UPSERT_CONCURRENCY at a time.
+    # Rows are projected straight into their batch (less per-row overhead; every
+    # batch is still held in memory until the gather below finishes).
     batch_size = 50
-    for i in range(0, len(clean), batch_size):
-        batch = clean[i:i + batch_size]
-        try:
-            _post("articles", batch, upsert=True)
-        except requests.HTTPError as e:
-            print(f"[SUPABASE] Error upserting articles batch {i}: {e}")
-            print(f"[SUPABASE] Response: {e.response.text if e.response else 'N/A'}")
-
-
-def merge_articles(existing: list[dict], new_articles: list[dict]) -> list[dict]:
+    rows = map(_article_row, articles)
+    batches = []
+    while batch := list(islice(rows, batch_size)):
+        batches.append(batch)
+    starts = range(0, len(articles), batch_size)
+    limiter = asyncio.Semaphore(UPSERT_CONCURRENCY)
+
+    async def upsert(batch: list[dict]) -> list[dict]:
+        """Upsert one batch once a concurrency slot is free."""
+        async with limiter:
+            return await _apost(client, "articles", batch, upsert=True, minimal=minimal)
+
+    async with _write_client() as client:
+        results = await asyncio.gather(*[upsert(b) for b in batches], return_exceptions=True)
+    # A rejected batch is logged and skipped; anything else (connection
+    # failure, timeout) is re-raised once every batch has finished.
+    failure = None
+    for i, result in zip(starts, results):
+        if isinstance(result, httpx.HTTPStatusError):
+            print(f"[SUPABASE] Error upserting articles batch {i}: {result}")
+            print(f"[SUPABASE] Response: {result.response.text}")
+        elif isinstance(result, BaseException):
+            print(f"[SUPABASE] Error upserting articles batch {i}: {result}")
+            failure = failure or result
+    if failure:
+        raise failure
+
+
+def merge_articles(
+    existing: list[dict] | MergeIndex,
+    new_articles: list[dict],
+    return_merged: bool = False,
+    limit: int | None = MERGE_LIMIT,
+) -> list[dict]:
     """
-    Merge new articles with existing, dedup by ID.
-    Then upsert ALL into Supabase.
-    Returns the merged list.
+    Merge new articles with existing, dedup by ID and by title+subtitle
+    SimHash (near-duplicates of an already-kept article are dropped).
+    `existing` is either a row list or a long-lived MergeIndex already
+    holding them, which is updated in place (and pruned to `limit` when
+    return_merged) instead of being re-indexed on every call.
+    The accepted new articles are upserted (return=minimal); id-level dedup
+    against stored rows happens server-side via merge-duplicates, so
+    `existing` may be empty when only the write is needed.
+    Returns the newest `limit` merged articles if return_merged (limit=None
+    for all of them), else all accepted new articles, sorted by
+    published_date descending.
     """
-    by_id = {a["id"]: a for a in existing}
-    for a in new_articles:
-        by_id[a["id"]] = a
-    merged = list(by_id.values())
-    merged.sort(key=lambda a: a.get("published_date") or "", reverse=True)
+    index = existing if isinstance(existing, MergeIndex) else MergeIndex(existing)
+    merged = index.merge(new_articles, limit if return_merged else None)
 
     # Upsert only the new/updated articles to Supabase
-    save_articles(new_articles)
+    save_articles(index.accepted)
 
-    return merged
+    return merged if return_merged else newest_first(index.accepted, None)
 
 
 # ---------------------------------------------------------------------------
@@ -146,29 +359,69 @@ def load_saved_ids() -> list[dict]:
     return _get("saved_articles", {"order": "saved_at.desc"})
 
 
+def save_bookmarks(article_ids: list[str]) -> list[dict]:
+    """
+    Save/bookmark several articles in one request. Returns the saved entries.
+    Already-saved ids are upserted on article_id instead of conflicting.
+    """
+    if not article_ids:
+        return []
+    global _saved_ids_cache
+    saved_at = datetime.now(timezone.utc).isoformat()
+    rows = [{"article_id": i, "saved_at": saved_at} for i in article_ids]
+    saved = _post(
+        "saved_articles", rows, upsert=True, params={"on_conflict": "article_id"}, minimal=False
+    )
+    # Cleared only after the write, so a concurrent read can't re-cache the old set
+    _saved_ids_cache = None
+    return saved
+
+
 def save_bookmark(article_id: str) -> dict:
     """Save/bookmark an article. Returns the saved entry."""
-    try:
-        result = _post("saved_articles", {
-            "article_id": article_id,
-            "saved_at": datetime.now(timezone.utc).isoformat(),
-        })
-        return result[0] if result else {}
-    except requests.HTTPError as e:
-        if e.response and e.response.status_code == 409:
-            return {"status": "already_saved", "article_id": article_id}
-        raise
+    # An upsert on article_id, so re-saving an already saved article can't conflict
+    result = save_bookmarks([article_id])
+    return result[0] if result else {}
+
+
+def _in_filter(values: list[str]) -> str:
+    """
+    PostgREST `in.(...)` filter with every value double-quoted and escaped, so
+    commas, parentheses or quotes in a (user-supplied) id can't add values.
+    """
+    quoted = ('"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values)
+    return f"in.({','.join(quoted)})"
+
+
+def remove_bookmarks(article_ids: list[str]) -> bool:
+    """Remove several bookmarks in one request."""
+    if not article_ids:
+        return True
+    global _saved_ids_cache
+    removed = _delete("saved_articles", {"article_id": _in_filter(article_ids)})
+    _saved_ids_cache = None
+    return removed
 
 
 def remove_bookmark(article_id: str) -> bool:
     """Remove a bookmark."""
-    return _delete("saved_articles", {"article_id": f"eq.{article_id}"})
+    return remove_bookmarks([article_id])
+
+
+SAVED_IDS_TTL_SECONDS = 10
+_saved_ids_cache: tuple[float, set[str]] | None = None
 
 
 def get_saved_article_ids() -> set[str]:
-    """Get just the set of saved article IDs."""
+    """Get just the set of saved article IDs (memoized for SAVED_IDS_TTL_SECONDS)."""
+    global _saved_ids_cache
+    now = time.monotonic()
+    if _saved_ids_cache and now - _saved_ids_cache[0] < SAVED_IDS_TTL_SECONDS:
+        return _saved_ids_cache[1]
     entries = _get("saved_articles", {"select": "article_id"})
-    return {e["article_id"] for e in entries}
+    ids = {e["article_id"] for e in entries}
+    _saved_ids_cache = (now, ids)
+    return ids
 
 
 # ---------------------------------------------------------------------------
@@ -182,23 +435,71 @@ def load_scrape_state() -> dict:
 
 def save_scrape_state(state: dict):
     """Upsert scrape state entries."""
+    _run_sync(save_scrape_state_async(state))
+
+
+async def save_scrape_state_async(state: dict):
+    """Async variant of save_scrape_state."""
     rows = list(state.values()) if isinstance(state, dict) else state
     if not rows:
         return
     try:
-        _post("scrape_state", rows, upsert=True)
-    except requests.HTTPError as e:
+        async with _write_client() as client:
+            await _apost(client, "scrape_state", rows, upsert=True)
+    except httpx.HTTPStatusError as e:
         print(f"[SUPABASE] Error saving scrape state: {e}")
 
 
+# ---------------------------------------------------------------------------
+# Dashboard Bundle
+# ---------------------------------------------------------------------------
+def load_dashboard_bundle(source: str = None, saved: bool = False) -> dict:
+    """
+    Load articles, saved entries and scrape state in one round-trip via the
+    get_dashboard_bundle RPC (see schema.sql).
+    Returns {"articles": [...], "saved_ids": [...], "state": {source: row}}.
+    Falls back to the individual loaders if the RPC is not installed.
+    """
+    try:
+        bundle = _rpc("get_dashboard_bundle", {"source": source, "saved": saved})
+    except requests.HTTPError as e:
+        print(f"[SUPABASE] get_dashboard_bundle RPC failed, using separate reads: {e}")
+        saved_entries = load_saved_ids()
+        articles = load_articles(source)
+        if saved:
+            saved_id_set = {s["article_id"] for s in saved_entries}
+            articles = [a for a in articles if a["id"] in saved_id_set]
+        return {"articles": articles, "saved_ids": saved_entries, "state": load_scrape_state()}
+    return {
+        "articles": bundle.get("articles") or [],
+        "saved_ids": bundle.get("saved_ids") or [],
+        "state": {r["source"]: r for r in bundle.get("state") or []},
+    }
+
+
 # ---------------------------------------------------------------------------
 # Health Check
 # ---------------------------------------------------------------------------
+CONNECTION_OK_TTL_SECONDS = 60
+_connection_ok_at: float | None = None
+
+
 def check_connection() -> bool:
-    """Verify Supabase connection by querying the articles table."""
-    try:
-        _get("articles", {"limit": "1"})
+    """
+    Verify Supabase connection with a HEAD request on the articles table.
+    A successful check is trusted for CONNECTION_OK_TTL_SECONDS; failures are always re-probed.
+    """
+    global _connection_ok_at
+    now = time.monotonic()
+    if _connection_ok_at is not None and now - _connection_ok_at < CONNECTION_OK_TTL_SECONDS:
         return True
+    try:
+        resp = _head("articles", {"limit": "1"})
     except Exception as e:
         print(f"[SUPABASE] Connection check failed: {e}")
         return False
+    if resp.status_code >= 400:
+        print(f"[SUPABASE] Connection check failed: HTTP {resp.status_code}")
+        return False
+    _connection_ok_at = now
+    return True
@@ -92,7 +92,10 @@ def test_rundown_scraper():
 
 def test_tools():
     """Test utility functions."""
-    from tools import hash_url, parse_date, is_within_24h, truncate_summary, merge_articles
+    from tools import (
+        hash_url, parse_date, is_within_24h, truncate_summary, merge_articles, mark_new_articles,
+        MergeIndex,
+    )
     from datetime import datetime, timezone, timedelta
 
     print("\n" + "-" * 60)
@@ -122,6 +125,17 @@ def test_tools():
     assert is_within_24h(old) == False
     print("  ✓ is_within_24h: correct")
 
+    # mark_new_articles
+    flagged = [
+        {"id": "n", "published_date": recent.isoformat(), "is_new": False},
+        {"id": "o", "published_date": old.isoformat(), "is_new": False},
+        {"id": "u", "published_date": None},
+    ]
+    changed = mark_new_articles(flagged)
+    assert [a["is_new"] for a in flagged] == [True, False, False]
+    assert [a["id"] for a in changed] == ["n", "u"]
+    print("  ✓ mark_new_articles: correct")
+
     # truncate_summary
     long_text = "A" * 300
     short = truncate_summary(long_text, 200)
@@ -140,6 +154,23 @@ def test_tools():
     assert merged[0]["id"] == "b"  # newer first
     print("  ✓ merge_articles: dedup + sort correct")
 
+    # merge_articles: near-duplicate (same title, different URL/id) is dropped
+    repost = [{"id": "c", "title": "second!", "published_date": "2026-01-03"}]
+    merged = merge_articles(merged, repost)
+    assert [a["id"] for a in merged] == ["b", "a"]
+    print("  ✓ merge_articles: near-duplicate dropped")
+
+    # merge_articles: only the newest `limit` are kept
+    assert [a["id"] for a in merge_articles(merged, [], limit=1)] == ["b"]
+    print("  ✓ merge_articles: limit keeps newest")
+
+    # MergeIndex: reused across merges, pruned to the returned rows
+    index = MergeIndex()
+    index.merge(new, limit=1)
+    assert list(index.by_id) == ["b"] and len(index.signatures) == 1
+    assert [a["id"] for a in index.merge(repost, limit=None)] == ["b"]
+    print("  ✓ MergeIndex: reused and pruned")
+
     return True
 
 
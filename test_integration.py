@@ -32,7 +32,7 @@ if ok and posts:
     print("\nUpserting Reddit posts to Supabase...")
     save_articles(posts)
     print("Done. Verifying...")
-    stored = load_articles("reddit")
+    stored = load_articles("reddit", columns=["id", "published_date"])
     print(f"Articles in Supabase (reddit): {len(stored)}")
 
 print("\n" + "=" * 60)
@@ -49,8 +49,7 @@ for src, count in by_source.items():
 
 if ok:
     print("\nMerging all into Supabase...")
-    existing = load_articles()
-    merged = merge_articles(existing, all_articles)
-    print(f"Total in Supabase after merge: {len(merged)}")
+    upserted = merge_articles([], all_articles)
+    print(f"Upserted into Supabase: {len(upserted)}")
 
 print("\nDone!")
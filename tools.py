@@ -5,11 +5,23 @@ No user interaction or side effects inside domain functions.
 """
 
 import hashlib
+import heapq
 import json
 import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -19,67 +31,221 @@ SAVED_FILE = DATA_DIR / "saved.json"
 SCRAPE_STATE_FILE = DATA_DIR / "scrape_state.json"
 
 
+# ---------------------------------------------------------------------------
+# Article Record
+# ---------------------------------------------------------------------------
+@dataclass(slots=True)
+class Article:
+    """
+    In-memory article row matching the Article schema in data_logic.md.
+    Slotted so long-lived caches hold no per-row __dict__; orjson
+    serializes it natively.
+    """
+
+    id: str
+    title: str | None = None
+    subtitle: str | None = None
+    url: str | None = None
+    source: str | None = None
+    source_display: str | None = None
+    author: str | None = None
+    published_date: str | None = None
+    scraped_at: str | None = None
+    thumbnail: str | None = None
+    summary: str | None = None
+    tags: tuple[str, ...] | list[str] = ()  # scrapers share tuples; rows from storage are lists
+    is_new: bool = False
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Article":
+        """Build an Article from a stored/scraped dict, ignoring unknown keys."""
+        return cls(
+            id=row["id"],
+            title=row.get("title"),
+            subtitle=row.get("subtitle"),
+            url=row.get("url"),
+            source=row.get("source"),
+            source_display=row.get("source_display"),
+            author=row.get("author"),
+            published_date=row.get("published_date"),
+            scraped_at=row.get("scraped_at"),
+            thumbnail=row.get("thumbnail"),
+            summary=row.get("summary"),
+            tags=row.get("tags") or (),
+            is_new=bool(row.get("is_new")),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Hashing
 # ---------------------------------------------------------------------------
-def hash_url(url: str) -> str:
+# Article ids are stored, so the algorithm must stay fixed for a given dataset.
+# BLAKE2b-64 emits the same 16 hex chars natively and is faster than SHA-256,
+# but yields different ids: opt in with URL_HASH=blake2b on a fresh store only.
+URL_HASH = os.getenv("URL_HASH", "sha256").lower()
+
+
+def _hash_url_sha256(url: str) -> str:
     """Generate a deterministic unique ID from a URL using SHA-256."""
     return hashlib.sha256(url.strip().encode("utf-8")).hexdigest()[:16]
 
 
+def _hash_url_blake2b(url: str) -> str:
+    """Generate a deterministic unique ID from a URL using BLAKE2b (8-byte digest)."""
+    return hashlib.blake2b(url.strip().encode("utf-8"), digest_size=8).hexdigest()
+
+
+hash_url = _hash_url_blake2b if URL_HASH == "blake2b" else _hash_url_sha256
+
+
+# ---------------------------------------------------------------------------
+# Near-Duplicate Detection
+# ---------------------------------------------------------------------------
+_WORD_RE = re.compile(r"\w+")
+SIMHASH_MAX_DISTANCE = 3
+
+
+@lru_cache(maxsize=4096)
+def simhash(text: str, width: int = 4) -> int:
+    """
+    64-bit SimHash of `text` over character `width`-grams.
+    Case and punctuation are ignored, so reposts with cosmetic edits land
+    within a few bits of each other.
+    """
+    normalized = "".join(_WORD_RE.findall(text.lower()))
+    grams = [normalized[i:i + width] for i in range(max(len(normalized) - width + 1, 1))]
+    weights = [0] * 64
+    for gram in grams:
+        h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def article_simhash(article: dict) -> int:
+    """SimHash of an article's title + subtitle, cached on the dict as `simhash`."""
+    if "simhash" not in article:
+        article["simhash"] = simhash(
+            f"{article.get('title') or ''} {article.get('subtitle') or ''}"
+        )
+    return article["simhash"]
+
+
+def is_near_duplicate(signature: int, signatures, max_distance: int = SIMHASH_MAX_DISTANCE) -> bool:
+    """True if `signature` is within `max_distance` bits of any of `signatures`."""
+    return any((signature ^ other).bit_count() <= max_distance for other in signatures)
+
+
 # ---------------------------------------------------------------------------
 # Date Utilities
 # ---------------------------------------------------------------------------
+# Regex pre-classifier: each shape maps to the only strptime formats that can
+# match it, so a miss costs a regex test instead of a raised ValueError.
+_DATE_PATTERNS = [
+    # "Jan 29, 2026" / "January 29, 2026"
+    (re.compile(r"^[A-Za-z]{3,9}\s+\d{1,2},\s+\d{4}$"), ("%b %d, %Y", "%B %d, %Y")),
+    # "Jan 29" / "January 29" (assume current year)
+    (re.compile(r"^[A-Za-z]{3,9}\s+\d{1,2}$"), ("%b %d", "%B %d")),
+    # "2026-01-29"
+    (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"), ("%Y-%m-%d",)),
+    # "29 Jan 2026" / "29 January 2026"
+    (re.compile(r"^\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}$"), ("%d %b %Y", "%d %B %Y")),
+]
+
+
+@lru_cache(maxsize=4096)
+def _strptime_date(date_str: str) -> tuple[datetime, bool] | None:
+    """
+    Cached half of parse_date: the UTC datetime for `date_str` plus whether
+    its format carried a year. Never depends on the current date.
+    """
+    s = date_str.strip()
+
+    for pattern, formats in _DATE_PATTERNS:
+        if not pattern.match(s):
+            continue
+        for fmt in formats:
+            try:
+                return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc), "%Y" in fmt
+            except ValueError:
+                continue
+        break
+    return None
+
+
 def parse_date(date_str: str) -> datetime | None:
     """
     Attempt to parse a date string from various newsletter formats.
     Returns a timezone-aware datetime or None on failure.
     """
-    formats = [
-        "%b %d, %Y",   # "Jan 29, 2026"
-        "%b %d",        # "Jan 29" (assume current year)
-        "%B %d, %Y",   # "January 29, 2026"
-        "%B %d",        # "January 29"
-        "%Y-%m-%d",     # "2026-01-29"
-        "%d %b %Y",    # "29 Jan 2026"
-        "%d %B %Y",    # "29 January 2026"
-    ]
-    cleaned = date_str.strip().upper().replace(",", ",").replace("  ", " ")
-    # Normalize month abbreviations
-    cleaned_lower = date_str.strip()
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(cleaned_lower, fmt)
-            # If no year was in the format, assume current year
-            if "%Y" not in fmt:
-                dt = dt.replace(year=datetime.now().year)
-            return dt.replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
-    return None
+    parsed = _strptime_date(date_str)
+    if parsed is None:
+        return None
+    dt, has_year = parsed
+    # If no year was in the format, assume current year (applied per call, so a
+    # long-running process picks up the new year after January 1)
+    return dt if has_year else dt.replace(year=datetime.now().year)
+
+
+# (monotonic timestamp, datetime) of the last datetime.now() taken by _now_cached;
+# swapped as one tuple so concurrent readers never see a half-updated pair
+_now_cache: tuple[float, datetime | None] = (float("-inf"), None)
 
 
-def is_within_24h(dt: datetime) -> bool:
-    """Check if a datetime is within the last 24 hours."""
+def _now_cached(ttl: float = 1.0) -> datetime:
+    """Current UTC time, reused for up to `ttl` seconds across calls (window checks only)."""
+    global _now_cache
+    ts, now = _now_cache
+    mono = time.monotonic()
+    if mono - ts >= ttl:
+        now = datetime.now(timezone.utc)
+        _now_cache = (mono, now)
+    return now
+
+
+def is_within_24h(dt: datetime, now: datetime | None = None) -> bool:
+    """Check if a datetime is within the last 24 hours (relative to `now` if given)."""
     if dt is None:
         return False
-    now = datetime.now(timezone.utc)
+    now = now or _now_cached()
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return (now - dt) <= timedelta(hours=24)
 
 
-def is_within_days(dt: datetime, days: int = 7) -> bool:
-    """Check if a datetime is within the last N days."""
+def is_within_days(dt: datetime, days: int = 7, now: datetime | None = None) -> bool:
+    """Check if a datetime is within the last N days (relative to `now` if given)."""
     if dt is None:
         return False
-    now = datetime.now(timezone.utc)
+    now = now or _now_cached()
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return (now - dt) <= timedelta(days=days)
 
 
+def mark_new_articles(articles: list[dict], now: datetime | None = None) -> list[dict]:
+    """
+    Set `is_new` on each article (published within the last 24 hours).
+    Returns the articles whose flag changed, so callers can persist only those.
+    """
+    now = now or datetime.now(timezone.utc)
+    changed = []
+    for a in articles:
+        is_new = False
+        if a.get("published_date"):
+            try:
+                pub = datetime.fromisoformat(a["published_date"])
+                if pub.tzinfo is None:
+                    pub = pub.replace(tzinfo=timezone.utc)
+                is_new = (now - pub).total_seconds() < 86400
+            except (ValueError, TypeError):
+                pass
+        if a.get("is_new") != is_new:
+            a["is_new"] = is_new
+            changed.append(a)
+    return changed
+
+
 def now_iso() -> str:
     """Return current UTC time as ISO 8601 string."""
     return datetime.now(timezone.utc).isoformat()
@@ -88,6 +254,10 @@ def now_iso() -> str:
 # ---------------------------------------------------------------------------
 # Text Utilities
 # ---------------------------------------------------------------------------
+_WS_RE = re.compile(r"\s+")
+_TRAIL_WS = re.compile(r"\s+\S*\Z")  # last whitespace run plus the partial word after it
+
+
 def truncate_summary(text: str | None, max_len: int = 200) -> str | None:
     """Truncate text to max_len characters, appending '…' if trimmed."""
     if not text:
@@ -95,14 +265,14 @@ def truncate_summary(text: str | None, max_len: int = 200) -> str | None:
     text = text.strip()
     if len(text) <= max_len:
         return text
-    return text[:max_len].rsplit(" ", 1)[0] + "…"
+    return _TRAIL_WS.sub("", text[:max_len]) + "…"
 
 
 def clean_text(text: str | None) -> str | None:
     """Remove excess whitespace and normalize a text string."""
     if not text:
         return None
-    return " ".join(text.split()).strip()
+    return _WS_RE.sub(" ", text).strip() or None
 
 
 # ---------------------------------------------------------------------------
@@ -117,15 +287,38 @@ def load_json(path: Path) -> dict | list:
     """Load JSON from a file. Returns empty dict/list if file doesn't exist."""
     if not path.exists():
         return [] if "articles" in str(path) or "saved" in str(path) else {}
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def save_json(path: Path, data: dict | list):
-    """Save data to a JSON file, creating the directory if needed."""
+    """
+    Save data to a JSON file, creating the directory if needed.
+    Written to a uniquely named temp file in the same directory and swapped
+    in with os.replace, so a crash mid-write never leaves a truncated file and
+    concurrent saves of one file can't interleave (the last replace wins).
+    """
     ensure_data_dir()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    if HAS_ORJSON:
+        payload = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            default=str,
+        )
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 
 # ---------------------------------------------------------------------------
@@ -162,15 +355,69 @@ def save_scrape_state(state: dict):
     save_json(SCRAPE_STATE_FILE, state)
 
 
-def merge_articles(existing: list[dict], new_articles: list[dict]) -> list[dict]:
+# Row cap for the Supabase store, matching the limit supabase_store.load_articles
+# reads back. The JSON store here keeps its whole history, so tools' merges default to None.
+MERGE_LIMIT = 200
+
+
+def _published_key(article: dict) -> str:
+    """Sort key: ISO published_date, missing dates last."""
+    return article.get("published_date") or ""
+
+
+def newest_first(articles, limit: int | None = None) -> list[dict]:
+    """
+    Return articles sorted by published_date descending, keeping only the
+    newest `limit` (bounded heap, O(N log K)). limit=None sorts everything.
+    """
+    if limit is None:
+        return sorted(articles, key=_published_key, reverse=True)
+    return heapq.nlargest(limit, articles, key=_published_key)
+
+
+class MergeIndex:
+    """
+    Caller-owned id index and SimHash list behind merge_articles. Keep one
+    across scrape cycles so each merge only touches the new articles instead
+    of re-indexing everything already kept.
+    """
+
+    def __init__(self, existing: list[dict] = ()):
+        self.by_id: dict[str, dict] = {a["id"]: a for a in existing}
+        self.signatures: list[int] = [article_simhash(a) for a in existing]
+        self.accepted: list[dict] = []  # new articles kept by the last merge()
+
+    def merge(self, new_articles: list[dict], limit: int | None = None) -> list[dict]:
+        """
+        Merge new_articles into the index (see merge_articles) and return the
+        newest `limit`. With a limit, the index is pruned to exactly those rows.
+        The new articles that were kept are recorded in self.accepted.
+        """
+        by_id, signatures = self.by_id, self.signatures
+        accepted = self.accepted = []
+        for article in new_articles:
+            signature = article_simhash(article)
+            if article["id"] not in by_id and is_near_duplicate(signature, signatures):
+                continue
+            by_id[article["id"]] = article
+            signatures.append(signature)
+            accepted.append(article)
+        merged = newest_first(by_id.values(), limit)
+        if limit is not None and len(merged) < len(by_id):
+            self.by_id = {a["id"]: a for a in merged}
+            self.signatures = [article_simhash(a) for a in merged]
+        return merged
+
+
+def merge_articles(
+    existing: list[dict], new_articles: list[dict], limit: int | None = None
+) -> list[dict]:
     """
     Merge new articles into existing list, deduplicating by ID.
-    New articles with the same ID update the existing entry.
-    Returns the merged list sorted by published_date descending.
-    """
-    by_id = {a["id"]: a for a in existing}
-    for article in new_articles:
-        by_id[article["id"]] = article
-    merged = list(by_id.values())
-    merged.sort(key=lambda a: a.get("published_date") or "", reverse=True)
-    return merged
+    New articles with the same ID update the existing entry; new articles
+    whose title+subtitle SimHash is within SIMHASH_MAX_DISTANCE bits of an
+    already-kept article (e.g. a cross-post at another URL) are dropped.
+    Returns the merged articles sorted by published_date descending, capped
+    to the newest `limit` if given (the JSON store keeps everything).
+    """
+    return MergeIndex(existing).merge(new_articles, limit)